@@ -5,12 +5,17 @@
 
 #include <pybind11/pybind11.h>
 #include <pybind11/numpy.h>
-#include <boost/math/special_functions/bessel.hpp>
+#include <pybind11/stl.h>
 #include <boost/math/quadrature/tanh_sinh.hpp>
 #include <boost/math/tools/roots.hpp>
 #include <boost/math/quadrature/gauss_kronrod.hpp>
+#include <algorithm>
 #include <iostream>
 #include <cmath>
+#include <cstddef>
+#include <cstdint>
+#include <optional>
+#include <random>
 #include <limits>
 #include <vector>
 #include <stdexcept>
@@ -20,40 +25,114 @@
 
 namespace py = pybind11;
 
+// C-contiguous float64 array; bound with noconvert() so calls never copy the input.
+using DoubleArray = py::array_t<double, py::array::c_style | py::array::forcecast>;
+using FloatArray = py::array_t<float, py::array::c_style | py::array::forcecast>;
+
 // Helper: Standard Normal CDF using the complementary error function.
 inline double norm_cdf(double x) {
     return 0.5 * std::erfc(-x * inv_sqrt2);
 }
 
-class CubicSpline {
+// Helper: one splitmix64 step, advancing state and returning the mixed output.
+inline uint64_t splitmix64(uint64_t& state) {
+    uint64_t z = (state += 0x9E3779B97F4A7C15ull);
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ull;
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBull;
+    return z ^ (z >> 31);
+}
+
+// Helper: xoshiro256++ generator (Blackman & Vigna), seeded through splitmix64.
+class Xoshiro256pp {
 public:
-    CubicSpline(py::array_t<double> x_array, py::array_t<double> y_array) {
+    explicit Xoshiro256pp(uint64_t seed) {
+        for (auto& word : s) {
+            word = splitmix64(seed);
+        }
+    }
+
+    uint64_t operator()() {
+        uint64_t result = rotl(s[0] + s[3], 23) + s[0];
+        uint64_t t = s[1] << 17;
+        s[2] ^= s[0];
+        s[3] ^= s[1];
+        s[1] ^= s[2];
+        s[0] ^= s[3];
+        s[2] ^= t;
+        s[3] = rotl(s[3], 45);
+        return result;
+    }
+
+    // Uniform double in (0, 1], built from the top 53 bits.
+    double uniform() {
+        return ((*this)() >> 11) * 0x1.0p-53 + 0x1.0p-53;
+    }
+
+private:
+    uint64_t s[4];
+
+    static uint64_t rotl(uint64_t x, int k) {
+        return (x << k) | (x >> (64 - k));
+    }
+};
 
-        auto buf_x = x_array.request();
-        auto buf_y = y_array.request();
-        if (buf_x.ndim != 1 || buf_y.ndim != 1)
-            throw std::runtime_error("x and y arrays must be one-dimensional");
-        if (buf_x.shape[0] != buf_y.shape[0])
+// Helper: exponentially scaled modified Bessel function exp(x) * K_1(x) for x > 0.
+// Uses the double precision rational approximations of Boost.Math's bessel_k1
+// (Boost Software License 1.0), inlined without policy checks or error handling so the
+// pdf loop vectorizes. Returning the scaled value lets the caller fold exp(-x) into
+// its own exponential.
+inline double bessel_k1e(double x) {
+    if (x <= 1) {
+        static const double Y = 8.69547128677368164e-02;
+        double t = x * x / 4;
+        double p = -3.62137953440350228e-03 + t * (7.11842087490330300e-03
+                 + t * (1.00302560256614306e-05 + t * 1.77231085381040811e-06));
+        double q = 1.0 + t * (-4.80414794429043831e-02
+                 + t * (9.85972641934416525e-04 + t * -8.91196859397070326e-06));
+        double i_part = ((p / q + Y) * t * t + t / 2 + 1) * x / 2;
+
+        double u = x * x;
+        double p2 = -3.07965757829206184e-01 + u * (-7.80929703673074907e-02
+                  + u * (-2.70619343754051620e-03 + u * -2.49549522229072008e-05));
+        double q2 = 1.0 + u * (-2.36316836412163098e-02
+                  + u * (2.64524577525962719e-04 + u * -1.49749618004162787e-06));
+        return (p2 / q2 * x + 1 / x + std::log(x) * i_part) * std::exp(x);
+    }
+    static const double Y = 1.45034217834472656;
+    double t = 1 / x;
+    double p = -1.97028041029226295e-01 + t * (-2.32408961548087617e+00
+             + t * (-7.98269784507699938e+00 + t * (-2.39968410774221632e+00
+             + t * (3.28314043780858713e+01 + t * (5.67713761158496058e+01
+             + t * (3.30907788466509823e+01 + t * (6.62582288933739787e+00
+             + t * 3.08851840645286691e-01)))))));
+    double q = 1.0 + t * (1.41811409298826118e+01
+             + t * (7.35979466317556420e+01 + t * (1.77821793937080859e+02
+             + t * (2.11014501598705982e+02 + t * (1.19425262951064454e+02
+             + t * (2.88448064302447607e+01 + t * (2.27912927104139732e+00
+             + t * 2.50358186953478678e-02)))))));
+    return (p / q + Y) / std::sqrt(x);
+}
+
+// Monotone piecewise cubic Hermite interpolant (PCHIP) on evenly spaced nodes.
+// Node derivatives come from centered differences and are limited so that every
+// segment stays monotone (Fritsch-Carlson), so the interpolant never overshoots
+// the data the way a global cubic spline can.
+class PchipSpline {
+public:
+    PchipSpline(const std::vector<double>& x_vals, const std::vector<double>& y_vals) {
+        if (x_vals.size() != y_vals.size())
             throw std::runtime_error("x and y arrays must have the same length");
-        n = buf_x.shape[0];
+        n = x_vals.size();
         if (n < 2)
             throw std::runtime_error("At least two data points are required for spline interpolation");
-
-        // Copy nodes and function values.
-        x.resize(n);
-        a.resize(n);
-        auto ptr_x = static_cast<double*>(buf_x.ptr);
-        auto ptr_y = static_cast<double*>(buf_y.ptr);
-
-        for (size_t i = 0; i < n; i++) {
-            x[i] = ptr_x[i];
-            a[i] = ptr_y[i];
-        }
+        if (n > static_cast<size_t>(std::numeric_limits<int>::max()))
+            throw std::runtime_error("Too many data points for spline interpolation");
+        const std::vector<double>& x = x_vals;
+        a = y_vals;
 
         x_front = x[0];
         x_back = x[n-1];
-        a_front = a[0];
-        a_back = a[n-1];
+        last_segment = static_cast<int>(n) - 2;
 
         // Because we assume evenly spaced x, compute and store spacing.
         spacing = x[1] - x[0];
@@ -63,205 +142,327 @@ public:
             if (std::abs(current_spacing - spacing) > 1e-2)
                 throw std::runtime_error("x array is not evenly spaced");
         }
-        // Compute interval widths h[i] = spacing (constant)
-        std::vector<double> h(n - 1, spacing);
 
-        // Estimate the endpoint derivatives using one-sided differences.
-        double fprime0 = (a[1] - a[0]) / spacing;
-        double fprimen = (a[n-1] - a[n-2]) / spacing;
+        // Secant slopes of the segments.
+        std::vector<double> delta(n - 1);
+        for (size_t i = 0; i < n - 1; i++)
+            delta[i] = (a[i+1] - a[i]) * _inv_spacing;
 
-        // Build the alpha vector.
-        std::vector<double> alpha(n, 0.0);
-        alpha[0] = 3.0 * ((a[1] - a[0]) / spacing - fprime0);
-        alpha[n-1] = 3.0 * (fprimen - (a[n-1] - a[n-2]) / spacing);
-        for (size_t i = 1; i < n - 1; i++) {
-            alpha[i] = 3.0/spacing * (a[i+1] - a[i]) - 3.0/spacing * (a[i] - a[i-1]);
+        // Node derivatives: fourth-order centered differences in the interior, second-order
+        // next to the ends, one-sided three-point differences at the ends.
+        std::vector<double> m(n);
+        if (n == 2) {
+            m[0] = m[1] = delta[0];
+        } else {
+            m[0] = 0.5 * (3.0 * delta[0] - delta[1]);
+            m[n-1] = 0.5 * (3.0 * delta[n-2] - delta[n-3]);
+            for (size_t i = 1; i < n - 1; i++) {
+                if (i >= 2 && i + 2 < n)
+                    m[i] = (a[i-2] - 8.0 * a[i-1] + 8.0 * a[i+1] - a[i+2]) / (12.0 * spacing);
+                else
+                    m[i] = 0.5 * (delta[i-1] + delta[i]);
+            }
         }
 
-        std::vector<double> l(n, 0.0), mu(n, 0.0), z(n, 0.0);
-        l[0] = 2.0 * spacing;
-        mu[0] = 0.5;
-        z[0] = alpha[0] / l[0];
-        for (size_t i = 1; i < n - 1; i++) {
-            l[i] = 2.0 * (x[i+1] - x[i-1]) - spacing * mu[i-1];
-            mu[i] = spacing / l[i];
-            z[i] = (alpha[i] - spacing * z[i-1]) / l[i];
+        // Monotonicity limiter: flat at local extrema and |m| <= 3 * min(|delta|) otherwise.
+        for (size_t i = 0; i < n; i++) {
+            double d_left = i > 0 ? delta[i-1] : delta[0];
+            double d_right = i < n - 1 ? delta[i] : delta[n-2];
+            if (d_left * d_right <= 0.0 || m[i] * d_left <= 0.0) {
+                m[i] = 0.0;
+                continue;
+            }
+            double bound = 3.0 * std::min(std::abs(d_left), std::abs(d_right));
+            if (std::abs(m[i]) > bound)
+                m[i] = std::copysign(bound, m[i]);
         }
-        l[n-1] = spacing * (2 - mu[n-2]);
-        z[n-1] = (alpha[n-1] - spacing * z[n-2]) / l[n-1];
-
-        c.resize(n, 0.0);
-        b.resize(n - 1, 0.0);
-        d.resize(n - 1, 0.0);
-        c[n-1] = z[n-1];
-        // Back substitution.
-        for (int j = n - 2; j >= 0; j--) {
-            c[j] = z[j] - mu[j] * c[j+1];
-            b[j] = (a[j+1] - a[j]) / spacing - spacing * (c[j+1] + 2.0 * c[j]) / 3.0;
-            d[j] = (c[j+1] - c[j]) / (3.0 * spacing);
+
+        // Power-basis coefficients of each segment in dx = x - x[i].
+        b.resize(n - 1);
+        c.resize(n - 1);
+        d.resize(n - 1);
+        for (size_t i = 0; i < n - 1; i++) {
+            b[i] = m[i];
+            c[i] = (3.0 * delta[i] - 2.0 * m[i] - m[i+1]) * _inv_spacing;
+            d[i] = (m[i] + m[i+1] - 2.0 * delta[i]) * _inv_spacing * _inv_spacing;
         }
+
+        // Single precision copy of the table for the float32 path.
+        a_f.assign(a.begin(), a.end());
+        b_f.assign(b.begin(), b.end());
+        c_f.assign(c.begin(), c.end());
+        d_f.assign(d.begin(), d.end());
+        x_front_f = static_cast<float>(x_front);
+        x_back_f = static_cast<float>(x_back);
+        spacing_f = static_cast<float>(spacing);
+        inv_spacing_f = static_cast<float>(_inv_spacing);
     }
 
+    // Branch-free so the array loops can vectorize: clamp into the node range, then the
+    // segment index follows directly from the even spacing.
     double operator()(double x_val) const {
-        if (x_val <= x_front)
-            return a_front;
-        if (x_val >= x_back)
-            return a_back;
-
-        // Since x is evenly spaced, compute the index directly.
-        size_t low = static_cast<size_t>((x_val - x_front) * _inv_spacing);
-        if (low >= n - 1)
-            low = n - 2;
-        double dx = x_val - x[low];
+        double xc = std::min(std::max(x_val, x_front), x_back);
+        // Clamp the segment in floating point first: NaN falls through to segment 0 (and dx
+        // stays NaN), instead of an undefined int conversion indexing out of bounds.
+        int low = static_cast<int>(std::max(0.0, std::min((xc - x_front) * _inv_spacing, double(last_segment))));
+        double dx = xc - (x_front + low * spacing);
         return a[low] + (b[low] + (c[low] + d[low] * dx) * dx) * dx;
     }
 
+    // Same evaluation in single precision: half the coefficient traffic and twice the SIMD lanes.
+    float operator()(float x_val) const {
+        float xc = std::min(std::max(x_val, x_front_f), x_back_f);
+        // float(last_segment) can round up past 2^24 segments, so re-clamp after converting.
+        int low = std::min(static_cast<int>(std::max(0.0f, std::min((xc - x_front_f) * inv_spacing_f, float(last_segment)))), last_segment);
+        float dx = xc - (x_front_f + low * spacing_f);
+        return a_f[low] + (b_f[low] + (c_f[low] + d_f[low] * dx) * dx) * dx;
+    }
+
 private:
-    std::vector<double> x;
     std::vector<double> a;
     std::vector<double> b;
     std::vector<double> c;
     std::vector<double> d;
     double x_front;
     double x_back;
-    double a_front;
-    double a_back;
     double spacing;
     double _inv_spacing;
+    int last_segment;
     size_t n;
+    std::vector<float> a_f;
+    std::vector<float> b_f;
+    std::vector<float> c_f;
+    std::vector<float> d_f;
+    float x_front_f;
+    float x_back_f;
+    float spacing_f;
+    float inv_spacing_f;
 };
 
 
 
 class NIG {
 public:
-    // Parameters: (alpha, beta, loc, scale)
-    double a, b, loc, scale;
-    size_t spline_points;
+    // Parameters: (alpha, beta, loc, scale). Fixed at construction, since the spline
+    // and the precomputed constants below depend on them.
+    const double a, b, loc, scale;
+    const size_t spline_points;
 
     NIG(double a_ = 1.5, double b_ = 0.5, double loc_ = 0.0, double scale_ = 1.0, size_t spline_points_ = 200)
-        : a(a_), b(b_), loc(loc_), scale(scale_), spline_points(spline_points_), spline_initialized(false) {
-            _exp_sqrt_a2_b2 = std::exp(std::sqrt(a*a-b*b));
-            _inv_scale = 1./scale;
+        : a(a_), b(b_), loc(loc_), scale(scale_), spline_points(spline_points_),
+          _sqrt_a2_b2(std::sqrt(a_*a_ - b_*b_)), _inv_scale(1./scale_), spline_initialized(false) {
             int numProcs = omp_get_num_procs();
             int maxThreads = omp_get_max_threads();
             std::cout << "NIG is using: " << numProcs << " Processors and " << maxThreads << " Threads." << std::endl; 
         }
 
-    // Compute the PDF for a 1-D NumPy array of x values.
-    py::array_t<double> pdf(py::array_t<double> input_array) const {
-        auto buf = input_array.request();
-        if (buf.ndim != 1)
-            throw std::runtime_error("Input should be a 1-D NumPy array");
-        size_t n = buf.shape[0];
-        auto result = py::array_t<double>(n);
-        auto r_in = input_array.unchecked<1>();
-        auto r_out = result.mutable_unchecked<1>();
+    // Compute the PDF elementwise; the result has the shape of the input.
+    DoubleArray pdf(DoubleArray input_array) const {
+        return pdf_into(input_array, DoubleArray(input_array.request().shape));
+    }
 
-        #pragma omp parallel for schedule(static)
-        for (size_t i = 0; i < n; i++){
-            double x_val = r_in(i);
-            r_out(i) = _pdf_single(x_val);
+    // Same as pdf, but writes into a caller-provided array so repeated calls do not allocate.
+    DoubleArray pdf_into(DoubleArray input_array, DoubleArray out_array) const {
+        auto buf = input_array.request();
+        ptrdiff_t n = buf.size;
+        const double* in = static_cast<const double*>(buf.ptr);
+        double* out = output_data(out_array, n);
+
+        #pragma omp parallel for simd schedule(static)
+        for (ptrdiff_t i = 0; i < n; i++){
+            double x_val = in[i];
+            out[i] = pdf_single(x_val);
         }
-        return result;
+        return out_array;
     }
 
-    py::array_t<double> cdf(py::array_t<double> input_array) const {
+    DoubleArray cdf(DoubleArray input_array) const {
+        return cdf_into(input_array, DoubleArray(input_array.request().shape));
+    }
+
+    DoubleArray cdf_into(DoubleArray input_array, DoubleArray out_array) const {
         auto buf = input_array.request();
-        if (buf.ndim != 1)
-            throw std::runtime_error("Input should be a 1-D NumPy array");
-        size_t n = buf.shape[0];
-        auto result = py::array_t<double>(n);
-        auto r_in = input_array.unchecked<1>();
-        auto r_out = result.mutable_unchecked<1>();
+        ptrdiff_t n = buf.size;
+        const double* in = static_cast<const double*>(buf.ptr);
+        double* out = output_data(out_array, n);
+
+        // The quadrature cost varies strongly with x, so hand out small chunks dynamically.
+        #pragma omp parallel for schedule(dynamic, 8)
+        for (ptrdiff_t i = 0; i < n; i++){
+            double x_val = in[i];
+            out[i] = cdf_single(x_val);
+        }
+        return out_array;
+    }
+
+    // Draw NIG samples by pushing standard normals through the ppf(Phi(z)) spline. Normals
+    // come from Box-Muller on xoshiro256++ and go straight into the spline, so no
+    // intermediate array is materialized. The rare normals outside the spline range are
+    // solved exactly with normal_to_nig_node, so the tails are not truncated. The output is
+    // split into fixed blocks, each with its own generator seeded by hashing (seed, block)
+    // through splitmix64, so the result does not depend on the number of OpenMP threads.
+    DoubleArray rvs(size_t size, std::optional<uint64_t> seed) const {
+        auto result = DoubleArray(size);
+        double* out = result.mutable_data();
+        uint64_t base_seed = seed ? *seed : (static_cast<uint64_t>(std::random_device{}()) << 32) ^ std::random_device{}();
+
+        ensure_ppf_spline();
+        const PchipSpline& spline = *ppf_spline;
+
+        const ptrdiff_t block_size = 1 << 16;
+        const ptrdiff_t n = static_cast<ptrdiff_t>(size);
+        const ptrdiff_t n_blocks = (n + block_size - 1) / block_size;
 
         #pragma omp parallel for schedule(static)
-        for (size_t i = 0; i < n; i++){
-            double x_val = r_in(i);
-            r_out(i) = _cdf_single(x_val);
+        for (ptrdiff_t block = 0; block < n_blocks; block++){
+            uint64_t seed_state = base_seed;
+            uint64_t block_state = splitmix64(seed_state) + static_cast<uint64_t>(block);
+            Xoshiro256pp rng(splitmix64(block_state));
+            auto sample = [this, &spline](double z) {
+                return std::abs(z) <= spline_upper_limit ? spline(z) : normal_to_nig_node(z);
+            };
+            ptrdiff_t end = std::min(n, (block + 1) * block_size);
+            for (ptrdiff_t i = block * block_size; i < end; i += 2){
+                double r = std::sqrt(-2.0 * std::log(rng.uniform()));
+                double theta = 2.0 * M_PI * rng.uniform();
+                out[i] = sample(r * std::cos(theta));
+                if (i + 1 < end)
+                    out[i + 1] = sample(r * std::sin(theta));
+            }
         }
         return result;
     }
 
-    py::array_t<double> ppf(py::array_t<double> input_array) const {
+    DoubleArray ppf(DoubleArray input_array) const {
         auto buf = input_array.request();
-        if (buf.ndim != 1)
-            throw std::runtime_error("Input should be a 1-D NumPy array");
-        size_t n = buf.shape[0];
-        auto result = py::array_t<double>(n);
-        auto r_in = input_array.unchecked<1>();
-        auto r_out = result.mutable_unchecked<1>();
-
-        #pragma omp parallel for schedule(static)
-        for (size_t i = 0; i < n; i++){
-            double q = r_in(i);
-            r_out(i) = _ppf_single(q);
+        ptrdiff_t n = buf.size;
+        auto result = DoubleArray(buf.shape);
+        const double* in = static_cast<const double*>(buf.ptr);
+        double* out = result.mutable_data();
+
+        #pragma omp parallel for schedule(dynamic, 8)
+        for (ptrdiff_t i = 0; i < n; i++){
+            double q = in[i];
+            out[i] = ppf_single(q);
         }
         return result;
     }
 
-    py::array_t<double> nig_values_from_normal_values(py::array_t<double> input_array) const {
+    DoubleArray nig_values_from_normal_values(DoubleArray input_array) const {
+        return nig_values_from_normal_values_into(input_array, DoubleArray(input_array.request().shape));
+    }
+
+    DoubleArray nig_values_from_normal_values_into(DoubleArray input_array, DoubleArray out_array) const {
         auto buf = input_array.request();
-        if (buf.ndim != 1)
-            throw std::runtime_error("Input should be a 1-D NumPy array");
-        size_t n = buf.shape[0];
-        auto result = py::array_t<double>(n);
-        auto r_in = input_array.unchecked<1>();
-        auto r_out = result.mutable_unchecked<1>();
-
-        // Lazy initialization of the cubic spline approximation.
-        if (!spline_initialized) {
-            build_ppf_spline();
+        ptrdiff_t n = buf.size;
+        const double* in = static_cast<const double*>(buf.ptr);
+        double* out = output_data(out_array, n);
+
+        ensure_ppf_spline();
+        const PchipSpline& spline = *ppf_spline;
+
+        #pragma omp parallel for simd schedule(static)
+        for (ptrdiff_t i = 0; i < n; i++){
+            double x_val = in[i];
+            out[i] = spline(x_val);
         }
+        return out_array;
+    }
 
-        #pragma omp parallel for schedule(static)
-        for (size_t i = 0; i < n; i++){
-            double x_val = r_in(i);
-            r_out(i) = (*ppf_spline)(x_val);
+    // Single precision variant of nig_values_from_normal_values for throughput-bound callers;
+    // accurate to float precision rather than to the 1e-7 of the double path.
+    FloatArray nig_values_from_normal_values_f32(FloatArray input_array) const {
+        auto buf = input_array.request();
+        ptrdiff_t n = buf.size;
+        auto result = FloatArray(buf.shape);
+        const float* in = static_cast<const float*>(buf.ptr);
+        float* out = result.mutable_data();
+
+        ensure_ppf_spline();
+        const PchipSpline& spline = *ppf_spline;
+
+        #pragma omp parallel for simd schedule(static)
+        for (ptrdiff_t i = 0; i < n; i++){
+            float x_val = in[i];
+            out[i] = spline(x_val);
         }
         return result;
     }
 
+    // Scalar kernels, shared by the array methods above and the vectorized bindings.
+    double pdf_single(double x) const {
+        double y = (x - loc) * _inv_scale;
+        double sqrt_one_plus_y2 = std::sqrt(1 + y*y);
+        double z = a * sqrt_one_plus_y2;
+        // K_1(z) = exp(-z) * bessel_k1e(z); all exponentials are combined into one.
+        double right_factor = std::exp(_sqrt_a2_b2 + b*y - z);
+        double left_factor = a * bessel_k1e(z) / (M_PI * sqrt_one_plus_y2);
+        double res = left_factor * right_factor;
+        return res * _inv_scale;
+    }
+
+    double cdf_single(double x) const {
+        if (x < loc)
+            return integrate_pdf(cdf_lower_limit, x);
+        return 1 - integrate_pdf(x, cdf_upper_limit);
+    }
+
+    double ppf_single(double q) const {
+        auto f = [this, q](double x) -> double {
+            return cdf_single(x) - q;
+        };
+        auto [L, U] = quantile_bracket(f);
+        auto tol = boost::math::tools::eps_tolerance<double>(30);
+        auto r = boost::math::tools::bisect(f, L, U, tol);
+        double root = (r.first + r.second) / 2.0;
+        return root;
+    }
+
+    double nig_value_from_normal_value_single(double x) const {
+        ensure_ppf_spline();
+        return (*ppf_spline)(x);
+    }
+
 private:
     // Precomputed values for pdf
-    double _exp_sqrt_a2_b2;
-    double _inv_scale;
+    const double _sqrt_a2_b2;
+    const double _inv_scale;
+
+    // Writable data pointer of an output array, checked against the number of inputs.
+    static double* output_data(DoubleArray& out_array, ptrdiff_t n) {
+        if (out_array.size() != n)
+            throw std::runtime_error("out must have the same number of elements as the input");
+        return out_array.mutable_data();
+    }
 
     // Predefined integrator
     using TanhSinh = boost::math::quadrature::tanh_sinh<double>;
     mutable TanhSinh integrator;
+    static constexpr double cdf_lower_limit = -60;
+    static constexpr double cdf_upper_limit = 60;
+    // Standard normal range covered by the ppf spline; it is symmetric around 0.
+    static constexpr double spline_lower_limit = -5;
+    static constexpr double spline_upper_limit = 5;
 
-
-    double _pdf_single(double x) const {
-        double y = (x - loc) * _inv_scale;
-        double sqrt_one_plus_y2 = std::sqrt(1 + y*y);
-        double right_factor = _exp_sqrt_a2_b2 * std::exp(b*y);
-        double left_factor = a * boost::math::cyl_bessel_k(1, a * sqrt_one_plus_y2) / (M_PI * sqrt_one_plus_y2);
-        double res = left_factor * right_factor;
-        return res * _inv_scale;
-    }
-
-    double _cdf_single(double x) const {
+    double integrate_pdf(double lower, double upper) const {
         auto integrand = [this](double t) -> double {
-            double val = _pdf_single(t);
+            double val = pdf_single(t);
             return std::isfinite(val) ? val : 0.;
         };
         double tol = 1e-12;
-        double lower_limit = -60;
-        double upper_limit = 60;
-        double result = 0;
-        if (x < loc) {
-            result = integrator.integrate(integrand, lower_limit, x, tol);
-        } else {
-            result = 1 - integrator.integrate(integrand, x, upper_limit, tol);
-        }
-        return result;
+        return integrator.integrate(integrand, lower, upper, tol);
     }
 
-    double _ppf_single(double q) const {
-        auto f = [this, q](double x) -> double {
-            return _cdf_single(x) - q;
-        };
+    // 1 - cdf, integrated directly over the right tail for x >= loc.
+    double sf_single(double x) const {
+        if (x < loc)
+            return 1 - integrate_pdf(cdf_lower_limit, x);
+        return integrate_pdf(x, cdf_upper_limit);
+    }
+
+    // Widen [loc - 100 scale, loc + 100 scale] until the increasing function f changes sign.
+    template <typename F>
+    std::pair<double, double> quantile_bracket(F f) const {
         double L = loc - 100 * scale;
         double U = loc + 100 * scale;
         int iter = 0;
@@ -279,15 +480,43 @@ private:
         }
         if (iter == max_iter)
             throw std::runtime_error("Failed to find a suitable upper bound for PPF computation.");
-        auto tol = boost::math::tools::eps_tolerance<double>(30);
-        auto r = boost::math::tools::bisect(f, L, U, tol);
-        double root = (r.first + r.second) / 2.0;
-        return root;
+        return {L, U};
+    }
+
+    // Spline node of the composed map y = ppf(Phi(z)), solved directly in the normal
+    // variable z. The right half solves sf(y) = Phi(-z), so the tail probability is never
+    // formed as 1 - Phi(z). Newton steps use the pdf as the derivative of the cdf, which
+    // needs far fewer quadratures than bisection; Boost falls back to bisection inside
+    // the bracket if a step misbehaves.
+    double normal_to_nig_node(double z) const {
+        bool right_tail = z > 0;
+        double p = norm_cdf(right_tail ? -z : z);
+        auto g = [this, p, right_tail](double y) -> double {
+            return right_tail ? p - sf_single(y) : cdf_single(y) - p;
+        };
+        auto g_and_derivative = [this, &g](double y) {
+            return std::make_pair(g(y), pdf_single(y));
+        };
+        auto [L, U] = quantile_bracket(g);
+        // Start from the normal approximation with the NIG mean and standard deviation.
+        double gamma = std::sqrt(a*a - b*b);
+        double guess = loc + scale * (b / gamma + z * a / (gamma * std::sqrt(gamma)));
+        guess = std::min(std::max(guess, L), U);
+        std::uintmax_t max_iter = 100;
+        return boost::math::tools::newton_raphson_iterate(g_and_derivative, guess, L, U, 40, max_iter);
+    }
+
+
+    // Lazy initialization of the monotone spline approximation.
+    void ensure_ppf_spline() const {
+        if (!spline_initialized) {
+            build_ppf_spline();
+        }
     }
 
     void build_ppf_spline() const {
-        double start = -5;
-        double end = 5;
+        double start = spline_lower_limit;
+        double end = spline_upper_limit;
         std::vector<double> q_vals(spline_points);
         std::vector<double> ppf_vals(spline_points);
         double step = (end - start) / static_cast<double>(spline_points - 1);
@@ -295,19 +524,15 @@ private:
         #pragma omp parallel for schedule(static)
         for (size_t i = 0; i < spline_points; i++){
             double x_val = start + i * step;
-            double u = norm_cdf(x_val);
-            ppf_vals[i] = _ppf_single(u);
+            ppf_vals[i] = normal_to_nig_node(x_val);
             q_vals[i] = x_val;
         }
 
-        py::array_t<double> q_array(q_vals.size(), q_vals.data());
-        py::array_t<double> ppf_array(ppf_vals.size(), ppf_vals.data());
-
-        ppf_spline = std::make_unique<CubicSpline>(q_array, ppf_array);
+        ppf_spline = std::make_unique<PchipSpline>(q_vals, ppf_vals);
         spline_initialized = true;
     }
 
-    mutable std::unique_ptr<CubicSpline> ppf_spline;
+    mutable std::unique_ptr<PchipSpline> ppf_spline;
     mutable bool spline_initialized;
 };
 
@@ -321,13 +546,43 @@ PYBIND11_MODULE(nig, m) {
              py::arg("loc") = 0.0,
              py::arg("scale") = 1.0,
              py::arg("spline_points") = 200)
-        .def("pdf", &NIG::pdf,
-             "Compute the NIG pdf for each element in the provided 1-D NumPy array")
-        .def("cdf", &NIG::cdf,
-             "Compute the NIG cdf for each element in the provided 1-D NumPy array")
-        .def("ppf", &NIG::ppf,
-             "Compute the NIG ppf (inverse cdf) for each element in the provided 1-D NumPy array using a cubic spline approximation")
-        .def("nig_values_from_normal_values", &NIG::nig_values_from_normal_values,
+        .def_readonly("a", &NIG::a)
+        .def_readonly("b", &NIG::b)
+        .def_readonly("loc", &NIG::loc)
+        .def_readonly("scale", &NIG::scale)
+        .def_readonly("spline_points", &NIG::spline_points)
+        // Fast path: C-contiguous float64 arrays of any shape are read in place, without conversion.
+        .def("pdf", &NIG::pdf, py::arg("x").noconvert(),
+             "Compute the NIG pdf for each element of the provided C-contiguous float64 NumPy array")
+        .def("cdf", &NIG::cdf, py::arg("x").noconvert(),
+             "Compute the NIG cdf for each element of the provided C-contiguous float64 NumPy array")
+        .def("pdf", &NIG::pdf_into, py::arg("x").noconvert(), py::arg("out").noconvert(),
+             "Compute the NIG pdf of x into the preallocated C-contiguous float64 array out and return out")
+        .def("cdf", &NIG::cdf_into, py::arg("x").noconvert(), py::arg("out").noconvert(),
+             "Compute the NIG cdf of x into the preallocated C-contiguous float64 array out and return out")
+        .def("ppf", &NIG::ppf, py::arg("q").noconvert(),
+             "Compute the NIG ppf (inverse cdf) for each element of the provided C-contiguous float64 NumPy array using a cubic spline approximation")
+        .def("nig_values_from_normal_values", &NIG::nig_values_from_normal_values, py::arg("x").noconvert(),
              "Given an array of values from a normal variable, map them to NIG quantiles via "
-             "y = nig.ppf(norm.cdf(x)).");
+             "y = nig.ppf(norm.cdf(x)).")
+        .def("nig_values_from_normal_values", &NIG::nig_values_from_normal_values_into,
+             py::arg("x").noconvert(), py::arg("out").noconvert(),
+             "Map normal values x to NIG quantiles into the preallocated C-contiguous float64 array out and return out")
+        .def("rvs", &NIG::rvs, py::arg("size"), py::arg("seed") = py::none(),
+             "Draw size NIG samples by mapping xoshiro256++/Box-Muller normals through the "
+             "nig_values_from_normal_values spline (normals beyond its range are solved exactly); "
+             "the same seed gives the same samples")
+        .def("nig_values_from_normal_values_f32", &NIG::nig_values_from_normal_values_f32, py::arg("x"),
+             "Single precision nig_values_from_normal_values: converts the input to float32 and "
+             "returns float32 NIG quantiles, trading accuracy for throughput.")
+        // Fallback: scalars, lists, other dtypes and strided arrays broadcast through the scalar kernels.
+        .def("pdf", py::vectorize(&NIG::pdf_single), py::arg("x"),
+             "Compute the NIG pdf of a scalar or array-like, broadcasting like a NumPy ufunc")
+        .def("cdf", py::vectorize(&NIG::cdf_single), py::arg("x"),
+             "Compute the NIG cdf of a scalar or array-like, broadcasting like a NumPy ufunc")
+        .def("ppf", py::vectorize(&NIG::ppf_single), py::arg("q"),
+             "Compute the NIG ppf (inverse cdf) of a scalar or array-like, broadcasting like a NumPy ufunc")
+        .def("nig_values_from_normal_values", py::vectorize(&NIG::nig_value_from_normal_value_single), py::arg("x"),
+             "Map a scalar or array-like of normal values to NIG quantiles via y = nig.ppf(norm.cdf(x)), "
+             "broadcasting like a NumPy ufunc");
 }
@@ -30,8 +30,9 @@ NIG_PARAMS = [
 SPLINE_POINTS = 10_000
 
 
-# This fixture creates both the C++ and SciPy versions for each parameter set.
-@pytest.fixture(params=NIG_PARAMS)
+# This fixture creates both the C++ and SciPy versions for each parameter set. It is
+# module scoped so each spline is built once and shared by all tests of that parameter set.
+@pytest.fixture(params=NIG_PARAMS, scope="module")
 def nig_pair(request):
     A, B, LOC, SCALE = request.param
     cpp_nig = nig.NIG(A, B, LOC, SCALE, SPLINE_POINTS)
@@ -141,3 +142,106 @@ def test_nig_values_from_normal_values_monotonic_increasing(nig_pair):
     assert np.all(
         diffs >= 1e-8
     ), f"nig_values_from_normal_values result is not monotonic increasing for parameters {(A, B, LOC, SCALE)}!"
+
+
+def test_scalar_and_array_like_inputs_broadcast():
+    cpp_nig = nig.NIG(12, 4, 1.0, 10, 200)
+    xx_values = np.linspace(-UNIFORM_BOUNDS, UNIFORM_BOUNDS, 6)
+    expected_pdf = cpp_nig.pdf(xx_values)
+    expected_map = cpp_nig.nig_values_from_normal_values(xx_values / 5)
+
+    assert np.isclose(cpp_nig.pdf(float(xx_values[2])), expected_pdf[2])
+    assert np.allclose(cpp_nig.pdf(list(xx_values)), expected_pdf)
+    assert np.allclose(cpp_nig.pdf(xx_values.astype(np.float32)), expected_pdf, rtol=1e-5)
+    assert np.allclose(cpp_nig.pdf(xx_values.reshape(2, 3)), expected_pdf.reshape(2, 3))
+    assert np.allclose(cpp_nig.pdf(np.repeat(xx_values, 2)[::2]), expected_pdf)
+    assert np.allclose(
+        cpp_nig.nig_values_from_normal_values((xx_values / 5).reshape(3, 2)),
+        expected_map.reshape(3, 2),
+    )
+    assert np.isclose(cpp_nig.cdf(1.0), cpp_nig.cdf(np.array([1.0]))[0])
+
+
+def test_nig_values_from_normal_values_monotonic_with_coarse_spline(nig_pair):
+    A, B, LOC, SCALE, _, _ = nig_pair
+    coarse_nig = nig.NIG(A, B, LOC, SCALE, 20)
+    x_values = np.linspace(-6, 6, 100_000)
+    result = coarse_nig.nig_values_from_normal_values(x_values)
+    assert np.all(
+        np.diff(result) >= 0
+    ), f"coarse spline overshoots for parameters {(A, B, LOC, SCALE)}!"
+
+
+def test_nig_values_from_normal_values_nan_propagates():
+    cpp_nig = nig.NIG(1, 0.5, 0.0, 1, 200)
+    assert np.isnan(cpp_nig.nig_values_from_normal_values(np.array([np.nan, 0.0]))[0])
+    assert np.isnan(cpp_nig.nig_values_from_normal_values([np.nan])[0])
+    nan_f32 = np.array([np.nan, 0.0], dtype=np.float32)
+    assert np.isnan(cpp_nig.nig_values_from_normal_values_f32(nan_f32)[0])
+
+
+def test_nig_values_from_normal_values_f32_vs_f64(nig_pair):
+    A, B, LOC, SCALE, _, _ = nig_pair
+    cpp_nig = nig.NIG(A, B, LOC, SCALE, 500)
+    x_values = np.linspace(-6, 6, 100_000)
+    expected = cpp_nig.nig_values_from_normal_values(x_values)
+    result = cpp_nig.nig_values_from_normal_values_f32(x_values.astype(np.float32))
+    assert result.dtype == np.float32
+    assert np.allclose(
+        result, expected, atol=1e-5 * SCALE
+    ), f"float32 spline path deviates for parameters {(A, B, LOC, SCALE)}!"
+
+
+def test_pdf_and_cdf_into_preallocated_out():
+    cpp_nig = nig.NIG(12, 4, 1.0, 10, 200)
+    xx_values = np.linspace(-UNIFORM_BOUNDS, UNIFORM_BOUNDS, CDF_VALUES)
+    out = np.empty_like(xx_values)
+    assert cpp_nig.pdf(xx_values, out) is out
+    assert np.array_equal(out, cpp_nig.pdf(xx_values))
+    assert cpp_nig.cdf(xx_values, out=out) is out
+    assert np.array_equal(out, cpp_nig.cdf(xx_values))
+    assert cpp_nig.nig_values_from_normal_values(xx_values, out) is out
+    assert np.array_equal(out, cpp_nig.nig_values_from_normal_values(xx_values))
+    with pytest.raises(RuntimeError):
+        cpp_nig.pdf(xx_values, np.empty(3))
+
+
+def test_parameters_are_read_only(nig_pair):
+    A, B, LOC, SCALE, CPP_NIG, _ = nig_pair
+    assert (CPP_NIG.a, CPP_NIG.b, CPP_NIG.loc, CPP_NIG.scale) == (A, B, LOC, SCALE)
+    assert CPP_NIG.spline_points == SPLINE_POINTS
+    with pytest.raises(AttributeError):
+        CPP_NIG.a = A + 1
+
+
+def test_rvs_moments_and_reproducibility(nig_pair):
+    A, B, LOC, SCALE, CPP_NIG, SCIPY_NIG = nig_pair
+    samples = CPP_NIG.rvs(1_000_000, seed=42)
+    mean, var = SCIPY_NIG.stats(moments="mv")
+    assert samples.shape == (1_000_000,)
+    assert abs(samples.mean() - mean) < 5 * np.sqrt(var / samples.size)
+    assert np.isclose(samples.var(), var, rtol=2e-2)
+    assert np.array_equal(CPP_NIG.rvs(1_000, seed=7), CPP_NIG.rvs(1_000, seed=7))
+    assert not np.array_equal(CPP_NIG.rvs(1_000, seed=7), CPP_NIG.rvs(1_000, seed=8))
+
+
+def test_rvs_tails_beyond_spline_range_are_exact():
+    cpp_nig = nig.NIG(3, 1.5, 0.0, 1.2, 500)
+    scipy_nig = norminvgauss(3, 1.5, 0.0, 1.2)
+    samples = cpp_nig.rvs(20_000_000, seed=3)
+    lower, upper = cpp_nig.nig_values_from_normal_values(np.array([-5.0, 5.0]))
+    # No point mass at the spline end points; the tail draws map back to |z| > 5.
+    assert not np.any((samples == lower) | (samples == upper))
+    left, right = samples[samples < lower], samples[samples > upper]
+    assert left.size > 0 and right.size > 0
+    assert np.all(norm.ppf(scipy_nig.cdf(left)) < -5)
+    assert np.all(norm.isf(scipy_nig.sf(right)) > 5)
+
+
+def test_rvs_blocks_do_not_share_streams_across_seeds():
+    cpp_nig = nig.NIG(3, 1.5, 0.0, 1.2, 500)
+    block_size = 1 << 16
+    seed = 11
+    second_block = cpp_nig.rvs(2 * block_size, seed=seed)[block_size:]
+    first_block = cpp_nig.rvs(block_size, seed=seed ^ 0xD1B54A32D192ED03)
+    assert not np.array_equal(second_block, first_block)